@@ -7,6 +7,7 @@ from __future__ import (absolute_import, print_function,
                         division, unicode_literals)
 
 import os
+import sys
 
 from argparse import Namespace
 
@@ -46,7 +47,7 @@ class Export(NotebookCommand):
             PrologTimestamp.use_nil = True
         trial = Trial(trial_ref=args.trial)
         trial.dependency_config.read_args(args)
-        print(trial.prolog.export_text_facts())
+        trial.prolog.write_facts(sys.stdout)
         if args.rules:
             print("\n".join(trial.prolog.rules()))
 
@@ -7,14 +7,33 @@ from __future__ import (absolute_import, print_function,
                         division, unicode_literals)
 
 import os
+import sys
 
 from ..persistence.models import Trial
 from ..persistence import persistence_config
-from ..utils.io import print_msg
+from ..utils.io import print_msg, write_chunks
 
 from .command import Command
 
 
+def trial_texts():
+    """Generate the text of each trial"""
+    # Bind the templates once instead of parsing them again per trial
+    trial_text = "  Trial {0.id}: {0.command}\n".format
+    details_text = (
+        "{0}with code hash {1.code_hash}\n"
+        "{0}ran from {1.start} to {1.finish}\n"
+    ).format
+    duration_text = "{0}duration: {1}\n".format
+    for trial in Trial.list_rows():
+        text = trial_text(trial)
+        indent = " " * (text.index(": ") + 2)
+        text += details_text(indent, trial)
+        if trial.finish:
+            text += duration_text(indent, trial.finish - trial.start)
+        yield text
+
+
 class List(Command):
     """List all trials registered in the current directory"""
 
@@ -27,14 +46,4 @@ class List(Command):
     def execute(self, args):
         persistence_config.connect_existing(args.dir or os.getcwd())
         print_msg("trials available in the provenance store:", True)
-        for trial in Trial.all():
-            text = "  Trial {0.id}: {0.command}".format(trial)
-            indent = text.index(": ") + 2
-            print(text)
-            print("{indent}with code hash {t.code_hash}".format(
-                indent=" " * indent, t=trial))
-            print("{indent}ran from {t.start} to {t.finish}".format(
-                indent=" " * indent, t=trial))
-            if trial.finish:
-                print('{indent}duration: {t.duration_text}'.format(
-                    indent=" " * indent, t=trial))
+        write_chunks(sys.stdout, trial_texts())
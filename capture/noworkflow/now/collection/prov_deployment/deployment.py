@@ -20,7 +20,7 @@ from future.utils import viewitems
 from future.builtins import map as cvmap
 
 from ...persistence.models import EnvironmentAttr, Module, Dependency
-from ...persistence import content
+from ...persistence import content, relational
 from ...utils.io import print_msg, redirect_output
 from ...utils.metaprofiler import meta_profiler
 from ...utils.cross_version import string, default_string
@@ -190,7 +190,10 @@ class Deployment(object):
         tid = metascript.trial_id
         # Remove after save
         partial = True
-        EnvironmentAttr.fast_store(tid, metascript.environment_attrs_store,
-                                   partial)
-        Module.fast_store(tid, metascript.modules_store, partial)
-        Dependency.fast_store(tid, metascript.dependencies_store, partial)
+        with relational.engine.begin() as conn:
+            EnvironmentAttr.fast_store(
+                tid, metascript.environment_attrs_store, partial, conn=conn)
+            Module.fast_store(tid, metascript.modules_store, partial,
+                              conn=conn)
+            Dependency.fast_store(tid, metascript.dependencies_store, partial,
+                                  conn=conn)
@@ -16,7 +16,7 @@ import codecs
 
 from datetime import datetime
 
-from ...persistence import content
+from ...persistence import content, relational
 from ...persistence.models import Activation, ObjectValue, FileAccess, Trial
 from ...utils.cross_version import builtins
 
@@ -357,9 +357,14 @@ class Profiler(ExecutionProvider):
             now = datetime.now()
             Trial.fast_update(tid, now, self.metascript.docstring)
 
-        Activation.fast_store(tid, self.activations, partial)
-        ObjectValue.fast_store(tid, self.object_values, partial)
-        FileAccess.fast_store(tid, self.file_accesses, partial)
+        with relational.engine.begin() as conn:
+            self.store_objects(tid, partial, conn)
+
+    def store_objects(self, tid, partial, conn):
+        """Store execution objects within the transaction of conn"""
+        Activation.fast_store(tid, self.activations, partial, conn=conn)
+        ObjectValue.fast_store(tid, self.object_values, partial, conn=conn)
+        FileAccess.fast_store(tid, self.file_accesses, partial, conn=conn)
 
     def tearup(self):
         """Activate profiler"""
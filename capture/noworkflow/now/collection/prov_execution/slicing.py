@@ -666,10 +666,14 @@ class Tracer(Profiler):
             while len(self.activation_stack) > 1:
                 self.close_activation(None, "store", None)
         super(Tracer, self).store(partial=partial)
-        tid = self.trial_id
-        Variable.fast_store(tid, self.variables, partial)
-        VariableDependency.fast_store(tid, self.dependencies, partial)
-        VariableUsage.fast_store(tid, self.usages, partial)
+
+    def store_objects(self, tid, partial, conn):
+        """Store execution and slicing objects in the transaction of conn"""
+        super(Tracer, self).store_objects(tid, partial, conn)
+        Variable.fast_store(tid, self.variables, partial, conn=conn)
+        VariableDependency.fast_store(tid, self.dependencies, partial,
+                                      conn=conn)
+        VariableUsage.fast_store(tid, self.usages, partial, conn=conn)
 
     def view_slicing_data(self, show=True):
         """View captured slicing"""
@@ -22,14 +22,14 @@ from .now_ls_magic import NowLsMagic
 
 
 MAGICS = [
-    ("now_run", "line_cell", NowRun),
-    ("now_ip", "line", NowIpython),
-    ("now_set_default", "line", NowSetDefault),
-    ("now_sql", "cell", NowSQL),
-    ("now_prolog", "cell", NowProlog),
-    ("now_restore", "line", NowRestore),
-    ("now_schema", "line", NowSchema),
-    ("now_ls_magic", "line", NowLsMagic),
+    ("now_run", ("line", "cell"), NowRun),
+    ("now_ip", ("line",), NowIpython),
+    ("now_set_default", ("line",), NowSetDefault),
+    ("now_sql", ("cell",), NowSQL),
+    ("now_prolog", ("cell",), NowProlog),
+    ("now_restore", ("line",), NowRestore),
+    ("now_schema", ("line",), NowSchema),
+    ("now_ls_magic", ("line",), NowLsMagic),
 ]
 
 
@@ -40,14 +40,16 @@ class NoworkflowMagics(Magics):
     def __init__(self, shell):
         super(NoworkflowMagics, self).__init__(shell=shell)
         self.commands = [
-            cls(command, cls.__doc__, magic_type=magic_type)
-            for command, magic_type, cls in MAGICS
+            cls(command, cls.__doc__, magic_types=magic_types)
+            for command, magic_types, cls in MAGICS
         ]
         self.now_magics = defaultdict(dict)
         self._generate_magics()
 
     def _generate_magics(self):
         """Generate noWorkflow magics"""
+        magics = self.magics
+        now_magics = self.now_magics
         for command in self.commands:
             command.add_arguments()
 
@@ -57,9 +59,9 @@ class NoworkflowMagics(Magics):
                 return command.execute(command.func, line, cell, self)
 
             command.func = command.create_magic(func)
-            for typ in command.magic_type.split("_"):
-                self.magics[typ][command.magic] = command.func
-                self.now_magics[typ][command.magic] = command.func
+            for typ in command.magic_types:
+                magics[typ][command.magic] = command.func
+                now_magics[typ][command.magic] = command.func
 
 
 def register_magics(ipython):
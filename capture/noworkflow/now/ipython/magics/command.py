@@ -17,23 +17,23 @@ from ...utils.functions import abstract
 
 
 MAGIC_TYPES = {
-    "cell": cell_magic,
-    "line": line_magic,
-    "line_cell": line_cell_magic
+    ("cell",): cell_magic,
+    ("line",): line_magic,
+    ("line", "cell"): line_cell_magic
 }
 
 
 class IpythonCommandMagic(Command):
     """IPython Command base"""
 
-    def __init__(self, magic, docstring, magic_type="cell"):
+    def __init__(self, magic, docstring, magic_types=("cell",)):
         self.__doc__ = docstring
         self.__name__ = type(self).__name__
         super(IpythonCommandMagic, self).__init__()
         self.is_ipython = True
         self.magic = magic
         self.docstring = docstring
-        self.magic_type = magic_type
+        self.magic_types = magic_types
         self.args = []
 
     def add_argument_cmd(self, *args, **kwargs):
@@ -50,7 +50,7 @@ class IpythonCommandMagic(Command):
         """Create magic for command"""
         func.__name__ = str(self.magic)
         func.__doc__ = self.docstring
-        func = MAGIC_TYPES[self.magic_type](self.magic)(func)
+        func = MAGIC_TYPES[self.magic_types](self.magic)(func)
         for arg in self.args:
             func = arg(func)
         func = magic_arguments.magic_arguments()(func)
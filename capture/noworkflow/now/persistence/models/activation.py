@@ -6,14 +6,18 @@
 from __future__ import (absolute_import, print_function,
                         division, unicode_literals)
 
+from collections import defaultdict, namedtuple
+
 from future.builtins import map as cvmap
 from sqlalchemy import Column, Integer, Text, TIMESTAMP
-from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint, Index
 from sqlalchemy.orm import backref
 
 from ...utils.prolog import PrologDescription, PrologTrial, PrologTimestamp
 from ...utils.prolog import PrologAttribute, PrologRepr, PrologNullable
 
+from .. import relational
+
 from .base import AlchemyProxy, proxy_class, one, many_viewonly_ref, many_ref
 from .base import backref_one, backref_many, query_many_property
 from .object_value import ObjectValue
@@ -31,6 +35,9 @@ class Activation(AlchemyProxy):
         ForeignKeyConstraint(["trial_id", "caller_id"],
                              ["function_activation.trial_id",
                               "function_activation.id"], ondelete="CASCADE"),
+        # Activation.children: caller_id filter ordered by id
+        Index("ix_function_activation_caller",
+              "trial_id", "caller_id", "id"),
     )
     trial_id = Column(Integer, index=True)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
@@ -39,27 +46,35 @@ class Activation(AlchemyProxy):
     return_value = Column(Text)
     start = Column(TIMESTAMP)
     finish = Column(TIMESTAMP)
-    caller_id = Column(Integer, index=True)
+    caller_id = Column(Integer)
 
-    _children = backref("children", order_by="Activation.start")
+    # Activation ids follow the call order, like start, but compare as integers
+    _children = backref("children", order_by="Activation.id")
     caller = one(
         "Activation", remote_side=[trial_id, id],
         backref=_children, viewonly=True
     )
 
-    object_values = many_viewonly_ref("activation", "ObjectValue")
-    file_accesses = many_viewonly_ref("activation", "FileAccess")
+    # Rows are ordered by id to keep the chronological order
+    # regardless of the index chosen by the planner
+    object_values = many_viewonly_ref("activation", "ObjectValue",
+                                      order_by="ObjectValue.id")
+    file_accesses = many_viewonly_ref("activation", "FileAccess",
+                                      order_by="FileAccess.id")
 
-    variables = many_ref("activation", "Variable")
-    variables_usages = many_viewonly_ref("activation", "VariableUsage")
+    variables = many_ref("activation", "Variable", order_by="Variable.id")
+    variables_usages = many_viewonly_ref("activation", "VariableUsage",
+                                         order_by="VariableUsage.id")
     source_variables = many_viewonly_ref(
         "source_activation", "VariableDependency",
         primaryjoin=((id == VariableDependency.m.source_activation_id) &
-                     (trial_id == VariableDependency.m.trial_id)))
+                     (trial_id == VariableDependency.m.trial_id)),
+        order_by=VariableDependency.m.id)
     target_variables = many_viewonly_ref(
         "target_activation", "VariableDependency",
         primaryjoin=((id == VariableDependency.m.target_activation_id) &
-                     (trial_id == VariableDependency.m.trial_id)))
+                     (trial_id == VariableDependency.m.trial_id)),
+        order_by=VariableDependency.m.id)
 
     trial = backref_one("trial")  # Trial.activations
     children = backref_many("children")  # Activation.caller
@@ -101,21 +116,40 @@ class Activation(AlchemyProxy):
         "to *finish*."
     ))
 
-    # ToDo: Improve hash
-
     def __key(self):
-        return (self.trial_id, self.name, self.line)
+        return (self.trial_id, self.id)
 
     def __hash__(self):
-        return hash(self.__key())
+        return self._hash
 
     def __eq__(self, other):
+        if not isinstance(other, Activation):
+            return False
         return self.__key() == other.__key()                                     # pylint: disable=protected-access
 
+    def same_signature(self, other):
+        """Check if both activations have the same trial, name, and line"""
+        return (
+            (self.trial_id, self.name, self.line) ==
+            (other.trial_id, other.name, other.line)
+        )
+
+    def _restore_instance(self):
+        """Restore instance with new session. Reset cached duration and hash"""
+        super(Activation, self)._restore_instance()
+        self._duration = None
+        self._hash = hash(self.__key())
+
     @property
     def duration(self):
-        """Calculate activation duration"""
-        return int((self.finish - self.start).total_seconds() * 1000000)
+        """Calculate activation duration. Return microseconds
+
+        The value is computed on first access and cached in the proxy
+        """
+        if self._duration is None:
+            self._duration = int(
+                (self.finish - self.start).total_seconds() * 1000000)
+        return self._duration
 
     def show(self, _print=lambda x, offset=0: print(x)):
         """Show object
@@ -123,12 +157,15 @@ class Activation(AlchemyProxy):
         Keyword arguments:
         _print -- custom print function (default=print)
         """
-        global_vars = list(self.globals)
+        global_vars, arg_vars = [], []
+        by_type = {"GLOBAL": global_vars, "ARGUMENT": arg_vars}
+        for obj in self.object_values:
+            by_type[obj.type].append(obj)
+
         if global_vars:
             _print("{name}: {values}".format(
                 name="Globals", values=", ".join(cvmap(str, global_vars))))
 
-        arg_vars = list(self.arguments)
         if arg_vars:
             _print("{name}: {values}".format(
                 name="Arguments", values=", ".join(cvmap(str, arg_vars))))
@@ -143,11 +180,56 @@ class Activation(AlchemyProxy):
     def __repr__(self):
         return "Activation({0.trial_id}, {0.id}, {0.name})".format(self)
 
+    @classmethod  # query
+    def fast_graph_activations(cls, trial_id, session=None):
+        """Return trial activations ordered by id as ActivationRef tuples
+
+        Load only the columns used by trial graph summarizations
+        """
+        session = session or relational.session
+        model = cls.m
+        query = (
+            session.query(
+                model.trial_id, model.id, model.name, model.line,
+                model.caller_id, model.start, model.finish)
+            .filter(model.trial_id == trial_id)
+            .order_by(model.id)
+        )
+        for trial_id, aid, name, line, caller_id, start, finish in query:
+            yield ActivationRef(
+                trial_id, aid, name, line, caller_id,
+                int((finish - start).total_seconds() * 1000000))
+
+    @classmethod  # query
+    def fast_children_ids(cls, trial_id, session=None):
+        """Return dict of caller id -> list of activation ids ordered by id
+
+        Load the whole call hierarchy of the trial with a single query
+        """
+        session = session or relational.session
+        model = cls.m
+        query = (
+            session.query(model.id, model.caller_id)
+            .filter(model.trial_id == trial_id)
+            .order_by(model.id)
+        )
+        children = defaultdict(list)
+        for aid, caller_id in query:
+            children[caller_id].append(aid)
+        return children
+
+
+ActivationRef = namedtuple(                                                      # pylint: disable=invalid-name
+    "ActivationRef", "trial_id id name line caller_id duration")
+
 
 def _show_slicing(name, query, _print):
     """Show slicing objects"""
-    objects = list(query)
-    if objects:
-        _print(name)
-        for obj in objects:
-            _print(str(obj), 1)
+    objects = iter(query)
+    first = next(objects, None)
+    if first is None:
+        return
+    _print(name)
+    _print(str(first), 1)
+    for obj in objects:
+        _print(str(obj), 1)
@@ -10,14 +10,21 @@ import weakref
 
 from collections import OrderedDict, namedtuple
 from functools import wraps
+from itertools import islice
 
 from future.utils import with_metaclass, viewitems, viewvalues, viewkeys
-from sqlalchemy import Column
+from sqlalchemy import Column, select
 from sqlalchemy.orm import relationship
 
 from .. import relational
 
 
+# Compiled "INSERT OR REPLACE" statements of fast_store, shared by all chunks
+# and stores of a process. Keys are the cached insert constructs
+STORE_INSERTS = {}
+STORE_COMPILED_CACHE = {}
+
+
 class MetaModel(type):
     """Model metaclass
 
@@ -189,6 +196,7 @@ class AlchemyProxy(Model):
     m = __model__ = None                                                         # pylint: disable=invalid-name
     t = __table__ = None                                                         # pylint: disable=invalid-name
     __modelname__, __columns__ = None, []
+    __cached_relationships__ = ()
 
     def __init__(self, obj):
         super(AlchemyProxy, self).__init__(obj)
@@ -206,6 +214,8 @@ class AlchemyProxy(Model):
         obj = self._get_instance()
         for column in self.__columns__:
             setattr(self, column, getattr(obj, column))
+        for name in self.__cached_relationships__:
+            self.__dict__.pop(name, None)
 
     def _get_instance(self):
         return relational.session.query(self.__model__).get(self._alchemy_pk)
@@ -228,24 +238,67 @@ class AlchemyProxy(Model):
 
         return result
 
+    @classmethod  # query
+    def fast_export_rows(cls, trial_id, order_by=None, session=None):
+        """Stream trial rows for read-only exports
+
+        Return Core rows with column attributes, without building proxies
+        or ORM objects. Relationships are not available
+
+
+        Arguments:
+        trial_id -- trial id
+
+        Keyword arguments:
+        order_by -- order column name (default=None)
+        """
+        session = session or relational.session
+        table = cls.t
+        query = select([table]).where(table.c.trial_id == trial_id)
+        if order_by is not None:
+            query = query.order_by(table.c[order_by])
+        return session.execute(query)
+
     @classmethod
-    def fast_store(cls, trial_id, object_store, partial, conn=None):
-        """Bulk insert lightweight objects from ObjectStore"""
+    def fast_store(cls, trial_id, object_store, partial, conn=None,
+                   chunk_size=500):
+        """Bulk insert lightweight objects from ObjectStore
+
+        Objects are inserted by executemany in chunks of chunk_size,
+        all within a single transaction.
+        The insert statement is compiled once per process
+        """
         if object_store.has_items():
             _conn = conn if conn else relational.engine.connect()
-            _conn.execute(
-                cls.__model__.__table__.insert().prefix_with("OR REPLACE"),
-                *object_store.generator(trial_id, partial)
-            )
+            table = cls.__model__.__table__
+            insert = STORE_INSERTS.get(table)
+            if insert is None:
+                insert = STORE_INSERTS[table] = (
+                    table.insert().prefix_with("OR REPLACE"))
+            store_conn = _conn.execution_options(
+                compiled_cache=STORE_COMPILED_CACHE)
+            objects = object_store.generator(trial_id, partial)
+            with store_conn.begin():
+                chunk = list(islice(objects, chunk_size))
+                while chunk:
+                    store_conn.execute(insert, *chunk)
+                    chunk = list(islice(objects, chunk_size))
             if conn is None:
                 _conn.close()
 
-def create_relationship(proxy_func):
-    """Create proxy descriptor"""
+def create_relationship(proxy_func, cache=False):
+    """Create proxy descriptor
+
+    Keyword arguments:
+    cache -- store the proxied value in the instance (default=False)
+    """
     class Relationship(object):                                                  # pylint: disable=too-few-public-methods
         """Create a proxy for relationship
         Relationship on Model class will be prepended by _
+        Cached values are kept in the instance until _restore_instance
         """
+        cached = cache
+
         def __init__(self, *args, **kwargs):
             self.args = args
             self.kwargs = kwargs
@@ -255,7 +308,10 @@ def create_relationship(proxy_func):
             if obj is None:
                 return self
             alchemy = obj._get_instance()                                        # pylint: disable=protected-access
-            return proxy_func(getattr(alchemy, self.name))
+            value = proxy_func(getattr(alchemy, self.name))
+            if self.cached:
+                obj.__dict__[self.name] = value
+            return value
     return Relationship
 
 
@@ -268,7 +324,7 @@ def query_many_property(func):
 
 
 Many = create_relationship(proxy_gen)
-One = create_relationship(proxy)
+One = create_relationship(proxy, cache=True)
 
 
 def one(*args, **kwargs):
@@ -317,6 +373,7 @@ def proxy_class(cls):
     description = cls.__dict__
     attributes = {}
     to_remove = set()
+    cached = []
     for name, var in viewitems(description):
         if isinstance(var, Column):
             to_remove.add(name)
@@ -325,6 +382,8 @@ def proxy_class(cls):
         elif isinstance(var, (Many, One)):
             var.name = name
             attributes[var.name] = relationship(*var.args, **var.kwargs)
+            if var.cached:
+                cached.append(name)
         elif isinstance(var, ModelMethod):
             new_name = name
             setattr(cls, name, proxy_attr(new_name, proxy_func=var.proxy))
@@ -339,6 +398,7 @@ def proxy_class(cls):
     cls.m = cls.__model__ = type(cls.__name__, (relational.base,), attributes)
     cls.t = cls.__table__ = cls.__model__.__table__
     cls.__columns__ = cls.__table__.columns.keys()
+    cls.__cached_relationships__ = tuple(cached)
 
     AlchemyProxy.__alchemy_refs__[cls.__model__] = cls
 
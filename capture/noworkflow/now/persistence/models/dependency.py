@@ -32,7 +32,7 @@ class Dependency(AlchemyProxy):
     trial_id = Column(Integer, nullable=False, index=True)
     module_id = Column(Integer, nullable=False, index=True)
 
-    module = one("Module")
+    module = one("Module", lazy="joined")
 
     trial = backref_one("trial")  # Trial.module_dependencies
 
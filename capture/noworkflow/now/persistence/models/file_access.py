@@ -9,7 +9,7 @@ from __future__ import (absolute_import, print_function,
 import os
 
 from sqlalchemy import Column, Integer, Text, TIMESTAMP
-from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint, Index
 
 from ...utils.prolog import PrologDescription, PrologTrial, PrologAttribute
 from ...utils.prolog import PrologRepr, PrologTimestamp, PrologNullable
@@ -33,6 +33,11 @@ class FileAccess(AlchemyProxy):
                              ["function_activation.trial_id",
                               "function_activation.id"], ondelete="CASCADE"),
         ForeignKeyConstraint(["trial_id"], ["trial.id"], ondelete="CASCADE"),
+        # Activation.file_accesses
+        Index("ix_file_access_activation",
+              "trial_id", "function_activation_id"),
+        # find_by_name_and_time: name filter ordered by timestamp
+        Index("ix_file_access_name_timestamp", "name", "timestamp"),
     )
     trial_id = Column(Integer, index=True)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
@@ -42,7 +47,7 @@ class FileAccess(AlchemyProxy):
     content_hash_before = Column(Text)
     content_hash_after = Column(Text)
     timestamp = Column(TIMESTAMP)
-    function_activation_id = Column(Integer, index=True)
+    function_activation_id = Column(Integer)
 
     trial = backref_one("trial")  # Trial.file_accesses
     activation = backref_one("activation")  # Activation.file_accesses
@@ -34,7 +34,7 @@ class FunctionDef(AlchemyProxy):
     last_line = Column(Integer)
     docstring = Column(Text)
 
-    objects = many_ref("function_def", "Object")
+    objects = many_ref("function_def", "Object", order_by="Object.id")
 
     trial = backref_one("trial")  #  Trial.function_defs
 
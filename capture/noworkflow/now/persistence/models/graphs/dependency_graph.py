@@ -15,6 +15,7 @@ from future.utils import viewitems, viewkeys, viewvalues
 
 from .. import Activation, Variable, VariableDependency, FileAccess
 from .. import UniqueFileAccess
+from ..base import proxy
 
 
 class ActivationCluster(object):                                                 # pylint: disable=too-few-public-methods
@@ -27,6 +28,27 @@ class ActivationCluster(object):
         self.activation_id = aid
 
 
+COMPONENT_KINDS = {}
+
+
+def component_kind(component):
+    """Return cluster component kind: "cluster", "access", or "variable"
+
+    Classify each component class only once
+    """
+    cls = component.__class__
+    kind = COMPONENT_KINDS.get(cls)
+    if kind is None:
+        if issubclass(cls, ActivationCluster):
+            kind = "cluster"
+        elif issubclass(cls, FileAccess):
+            kind = "access"
+        else:
+            kind = "variable"
+        COMPONENT_KINDS[cls] = kind
+    return kind
+
+
 def variable_id(variable):
     """Return variable identification for .dot file"""
     if isinstance(variable, FileAccess):
@@ -161,6 +183,37 @@ class DependencyFilter(object):
         self.filtered_variables = set()
         self.dependencies = {}
         self.executed = False
+        # Loaded with a single query at the first call lookup
+        self.return_dependencies = None
+        # Loaded with a single query at the first access lookup
+        self.activation_accesses = None
+        # Loaded with a single query at the first traversal
+        self.activation_children = None
+
+    def _return_dependency(self, variable):
+        """Return "return" dependency of call variable"""
+        returns = self.return_dependencies
+        if returns is None:
+            returns = self.return_dependencies = (
+                Variable.fast_return_dependencies(self.trial.id))
+        return proxy(returns.get((variable.activation_id, variable.id)))
+
+    def _file_accesses(self, activation_id):
+        """Return file accesses of activation"""
+        accesses = self.activation_accesses
+        if accesses is None:
+            accesses = self.activation_accesses = defaultdict(list)
+            for access in self.trial.file_accesses:
+                accesses[access.function_activation_id].append(access)
+        return accesses.get(activation_id, ())
+
+    def _children_ids(self, activation_id):
+        """Return ids of activations called by activation"""
+        children = self.activation_children
+        if children is None:
+            children = self.activation_children = (
+                Activation.fast_children_ids(self.trial.id))
+        return children.get(activation_id, ())
 
     def _add_variable(self, variable, cluster=None):
         """Create variable in cluster
@@ -187,15 +240,22 @@ class DependencyFilter(object):
             if not variable in created and variable.type in self.valid_types:
                 self._add_variable(variable, cluster)
 
-    def _all_accesses(self, activation, depth):
-        """Get all file accesses recursively if it reaches the maximum depth"""
-        for access in activation.file_accesses:
-            if self.config.show_external_files or access.is_internal:
-                yield access
-        if depth + 1 > self.config.max_depth:
-            for act in activation.children:
-                for access in self._all_accesses(act, depth + 1):
+    def _all_accesses(self, activation_id, depth):
+        """Get all file accesses recursively if it reaches the maximum depth
+
+        Traverse activation ids in preorder with an explicit stack to avoid
+        nesting one generator per activation level
+        """
+        config = self.config
+        stack = [(activation_id, depth)]
+        while stack:
+            activation_id, depth = stack.pop()
+            for access in self._file_accesses(activation_id):
+                if config.show_external_files or access.is_internal:
                     yield access
+            if depth + 1 > config.max_depth:
+                children = self._children_ids(activation_id)
+                stack.extend((act, depth + 1) for act in reversed(children))
 
     def _add_call(self, variable, cluster, recursive_function):
         """Check if call is valid for subcluster
@@ -211,14 +271,14 @@ class DependencyFilter(object):
         subgraph -- user defined call within depth (create cluster)
         """
         accesses = self.accesses
-        return_ = variable.return_dependency
+        return_ = self._return_dependency(variable)
         if not return_:
             # Fake call
             return None, "fake"
         activation_id = variable.activation_id
         new_activation_id = return_.activation_id
         if self.config.show_accesses:
-            for access in self._all_accesses(return_.activation, cluster.depth):
+            for access in self._all_accesses(new_activation_id, cluster.depth):
                 access = UniqueFileAccess(access._alchemy_pk)
                 if (not self.config.combine_accesses or
                         access.name not in accesses):
@@ -419,13 +479,13 @@ class DependencyFilter(object):
                     self._add_all_variables(box.dependencies, cluster)
 
                 elif mode in ("c_call", "just_return"):
-                    return_ = variable.return_dependency
+                    return_ = self._return_dependency(variable)
                     box = return_.box_dependency
                     if box:
                         self._add_all_variables(box.dependencies, cluster)
 
                 elif mode == "max_depth":
-                    return_ = variable.return_dependency
+                    return_ = self._return_dependency(variable)
                     for var in return_.activation.param_variables:
                         self._add_all_variables(var.dependencies, cluster)
                 elif mode == "subgraph":
@@ -469,6 +529,10 @@ class DependencyFilter(object):
         self.current_cluster = self.main_cluster
         self.filtered_variables = set()
         self.dependencies = {}
+        # Reload lazily, the trial may have stored more provenance
+        self.return_dependencies = None
+        self.activation_accesses = None
+        self.activation_children = None
 
     def run(self):
         """Filter variables graph according to mode"""
@@ -487,6 +551,13 @@ class ActivationClusterVisitor(object):
 
     def __init__(self, dep_filter):
         self.filter = dep_filter
+        # Resolve the bound visit method of each component kind only once
+        self._visitors = {
+            "initial": self.visit_initial or self.visit_activation,
+            "cluster": self.visit_activation,
+            "access": self.visit_access or self.visit_variable,
+            "variable": self.visit_variable,
+        }
 
     def _ranks(self, cluster):
         for variables in cluster.same_rank:
@@ -505,18 +576,19 @@ class ActivationClusterVisitor(object):
 
     def visit(self, component):
         """Visit component"""
-        if isinstance(component, ActivationCluster):
-            if component.activation_id == -1 and self.visit_initial:
-                return self.visit_initial(component, self._ranks(component))     # pylint: disable=not-callable
-            if self.visit_activation:
-                return self.visit_activation(component, self._ranks(component))  # pylint: disable=not-callable
+        kind = component_kind(component)
+        if kind == "cluster":
+            if component.activation_id == -1:
+                kind = "initial"
+            visitor = self._visitors[kind]
+            if visitor:
+                return visitor(component, self._ranks(component))
         else:
             if not variable_id(component) in self.filter.filtered_variables:
                 return
-            if isinstance(component, FileAccess) and self.visit_access:
-                return self.visit_access(component)                              # pylint: disable=not-callable
-            if self.visit_variable:
-                return self.visit_variable(component)                            # pylint: disable=not-callable
+            visitor = self._visitors[kind]
+            if visitor:
+                return visitor(component)
         return self.visit_default(component)
 
     def visit_default(self, component):
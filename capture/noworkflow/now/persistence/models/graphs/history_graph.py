@@ -50,8 +50,10 @@ class HistoryGraph(Graph):
             self.history.script, self.history.status, self.history.summarize,
             Trial.count()
         )
-        if self.use_cache and key in self.cache:
-            return self.cache[key]
+        if self.use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
         tmap = self._load_trials(Trial.reverse_trials(MAXTRIALS))
         graph = self._create_graph(tmap)
@@ -163,17 +165,18 @@ class HistoryGraph(Graph):
         new_tmap = {}
 
         for tag in Tag.auto_tags():
-            if tag.trial_id not in trial_map:
+            trial = trial_map.get(tag.trial_id)
+            if trial is None:
                 continue  # Ignore filtered out
 
             tag_node = Version(tag.name.split('.')[:2])
-            trial = trial_map[tag.trial_id]
             trial.display = tag.name
             trial.tooltip = "<b> Trial {}</b><br>{}".format(
                 trial.display,
                 trial.tooltip
             )
-            if tag_node not in node_map:
+            node_obj = node_map.get(tag_node)
+            if node_obj is None:
                 node_obj = node_map[tag_node] = Node(tag_node)
 
                 parent_tag = new_tmap.get(trial.parent_id)
@@ -181,8 +184,6 @@ class HistoryGraph(Graph):
                     if (node_obj.parent_id is None or
                             node_obj.parent_id > parent_tag.nid):
                         node_obj.parent_id = parent_tag.nid
-            else:
-                node_obj = node_map[tag_node]
 
             new_tmap[tag.trial_id] = node_obj
             node_obj.insert(trial)
@@ -198,13 +199,15 @@ class HistoryGraph(Graph):
             new_graph[node.id][node.id] = 0
 
         for origin, distances in graph.items():
-            if origin not in new_tmap:
+            orig_obj = new_tmap.get(origin)
+            if orig_obj is None:
                 continue
-            orignode = new_tmap[origin].id
+            orignode = orig_obj.id
             for target, dist in distances.items():
-                if target not in new_tmap:
+                targ_obj = new_tmap.get(target)
+                if targ_obj is None:
                     continue
-                targnode = new_tmap[target].id
+                targnode = targ_obj.id
                 new_graph[orignode][targnode] = min(
                     new_graph[orignode][targnode], dist
                 )
@@ -364,13 +367,13 @@ class HistoryGraph(Graph):
             for trial in scripts[script]:
                 min_id = min(min_id, Version.as_version(trial.id))
                 max_id = max(max_id, Version.as_version(trial.id))
-                if trial.id not in actual_graph:
+                parent_id = actual_graph.get(trial.id)
+                if parent_id is None:
                     # trial is isolated
                     trial.level = level
                     level += 1
                     continue
 
-                parent_id = actual_graph[trial.id]
                 if children[parent_id].index(trial.id) > 0:
                     # trial is not the first child
                     # increase level
@@ -416,14 +419,15 @@ class HistoryGraph(Graph):
             active_levels[trial.level] = 1
             add_line(active_levels, trial, trial.level, width=width)
 
-            if trial.id not in to_level:
+            target_level = to_level.get(trial.id)
+            if target_level is None:
                 # First trial for script
                 active_levels[trial.level] = 0
 
-            elif to_level[trial.id] != trial.level:
+            elif target_level != trial.level:
                 # Start of new branch
                 active_levels[trial.level] = 0
-                for i in range(trial.level, to_level[trial.id], -1):
+                for i in range(trial.level, target_level, -1):
                     add_line(active_levels, trial, i, moving=True, width=width)
             if trial.parent_id is None:
                 active_levels[trial.level] = 0
@@ -20,6 +20,11 @@ from ....utils.cross_version import pickle
 from ....utils.io import print_msg
 
 
+# Version of cached graphs. Bump it when a summarization changes its output
+# to stop loading graphs cached by previous versions
+CACHE_VERSION = "v2"
+
+
 class Graph(object):                                                             # pylint: disable=too-few-public-methods
     """Graph superclass. Handle json transformation"""
     def escape_json(self, data):                                                 # pylint: disable=no-self-use
@@ -49,8 +54,8 @@ def prepare_cache(get_type):
                 cache_session = relational.make_session()
 
                 typ = get_type(self, *args, **kwargs)
-                attributes = " ".join(str(kwargs[a])
-                                      for a in attrs.split() if a in kwargs)
+                attributes = " ".join([CACHE_VERSION] + [
+                    str(kwargs[a]) for a in attrs.split() if a in kwargs])
 
                 information = (typ, name, attributes)
                 if self.use_cache:
@@ -14,6 +14,8 @@ from future.utils import viewitems
 
 from ....utils.data import DotDict
 
+from .. import Activation
+
 from .structures import prepare_cache
 from .structures import Graph
 
@@ -34,34 +36,37 @@ class Summarization(object):
         self.stack = []
         self.nodes = []
         self.matches = defaultdict(dict)
-        self.edges = defaultdict(
-            lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-        )
+        self.edges = defaultdict(lambda: defaultdict(int))
 
         self(preorder)
 
     def graph(self, colors, width=0, height=0):  # pylint: disable=too-many-locals
         """Generate JSON"""
-        min_duration = {}
-        max_duration = {}
+        bounds = {}
         edges = []
-        trials = set()
         for node in self.nodes:
             for trial_id, duration in viewitems(node.duration):
-                min_duration[trial_id] = min(
-                    min_duration.get(trial_id, float('inf')), duration)
-                max_duration[trial_id] = max(
-                    max_duration.get(trial_id, float('-inf')), duration)
-                trials.add(trial_id)
-        for source_nid, targets in viewitems(self.edges):
-            for target_nid, types in viewitems(targets):
-                for type_, count in viewitems(types):
-                    edges.append({
-                        'count': count,
-                        'source': source_nid,
-                        'target': target_nid,
-                        'type': type_,
-                    })
+                current = bounds.get(trial_id)
+                if current is None:
+                    bounds[trial_id] = (duration, duration)
+                else:
+                    bounds[trial_id] = (
+                        min(current[0], duration), max(current[1], duration)
+                    )
+        min_duration = {
+            trial_id: low for trial_id, (low, _) in viewitems(bounds)
+        }
+        max_duration = {
+            trial_id: high for trial_id, (_, high) in viewitems(bounds)
+        }
+        trials = set(bounds)
+        for (source_nid, target_nid, type_), count in viewitems(self.edges):
+            edges.append({
+                'count': count,
+                'source': source_nid,
+                'target': target_nid,
+                'type': type_,
+            })
         tlist = list(trials)
         if not tlist:
             tlist.append(0)
@@ -82,14 +87,17 @@ class Summarization(object):
         raise NotImplementedError("merge is not implemented")
 
     def calculate_match(self, node):
-        """Abstract: Calculate match. Return tuple"""
+        """Abstract: Calculate match. Return hashable key"""
         raise NotImplementedError("calculate_match is not implemented")
 
     def add_edge(self, source, target, type_, count=1):
-        """Add edge"""
+        """Add edge
+
+        Edges are keyed by (source index, target index, type) tuples
+        """
         ids = target.trial_ids
         trial_id = 0 if len(ids) > 1 else next(iter(ids))
-        self.edges[source.index][target.index][type_][trial_id] += count
+        self.edges[(source.index, target.index, type_)][trial_id] += count
 
     def insert_node(self, activation, parent, match=None):
         """Create node for activation
@@ -109,7 +117,7 @@ class Summarization(object):
             activations=defaultdict(list),
             duration=defaultdict(int),
             full_tooltip=False,
-            tooltip=defaultdict(str),
+            tooltip=defaultdict(list),
             children_index=-1,
             trial_ids=[],
             has_return=False,
@@ -180,23 +188,36 @@ class Summarization(object):
         return node
 
     def __call__(self, preorder):
+        # Bind insert methods once instead of looking them up per activation
+        insert_first = self.insert_first
+        insert_call = self.insert_call
+        insert_return = self.insert_return
+        insert_sequence = self.insert_sequence
 
         for call in preorder:
-            if not call.caller_id:
-                last = self.insert_first(call)
+            caller_id = call.caller_id
+            if not caller_id:
+                last = insert_first(call)
                 continue
-            if call.caller_id > last.caller_id:
-                last = self.insert_call(call, last)
+            if caller_id > last.caller_id:
+                last = insert_call(call, last)
                 continue
 
-            while call.caller_id < last.caller_id:
-                last = self.insert_return(last)
+            while caller_id < last.caller_id:
+                last = insert_return(last)
 
-            if call.caller_id == last.caller_id:
-                last = self.insert_sequence(call, last)
+            if caller_id == last.caller_id:
+                last = insert_sequence(call, last)
 
         while self.stack:
-            last = self.insert_return(last)
+            last = insert_return(last)
+
+        # Tooltips are collected as lists of parts. Join them once
+        for node in self.nodes:
+            node.tooltip = defaultdict(str, (
+                (trial_id, "".join(parts))
+                for trial_id, parts in viewitems(node.tooltip)
+            ))
 
         return self
 
@@ -213,23 +234,33 @@ class LineNameSummarization(Summarization):
         node.activations[trial_id].append(activation.id)
         node.duration[trial_id] += activation.duration
 
-        node.tooltip[trial_id] += "T{} - {}<br>Line {}<br>".format(
+        node.tooltip[trial_id].append("T{} - {}<br>Line {}<br>".format(
             trial_id, activation.id, activation.line
-        )
+        ))
 
     def calculate_match(self, node):
-        """Calculate match. Use line and name"""
+        """Calculate match. Use line and name. Return tuple"""
         return (node.line, node.name)
 
 
 class NoMatchSummarization(LineNameSummarization):
-    """Create repr for all nodes. Does not summarize tree"""
+    """Create repr for all nodes. Does not summarize tree
+
+    While the tree is traversed, node.repr is a list of parts.
+    Parts are joined into a str once, after the traversal
+    """
     # ToDo: Diff equivalent
 
     def __init__(self, preorder):
         self.match_id = 0
         super(NoMatchSummarization, self).__init__(preorder)
 
+    def __call__(self, preorder):
+        result = super(NoMatchSummarization, self).__call__(preorder)
+        for node in self.nodes:
+            node.repr = "".join(node.repr)
+        return result
+
     def calculate_match(self, node):
         """No match"""
         self.match_id += 1
@@ -240,26 +271,28 @@ class NoMatchSummarization(LineNameSummarization):
         node = super(NoMatchSummarization, self).insert_node(
             activation, parent, match
         )
-        node.repr = '{0.line}-{0.name}'.format(activation)
+        node.repr = ['{0.line}-{0.name}'.format(activation)]
         return node
 
     def insert_call(self, call, last):
         """Insert call.
         Add opening parenthesis to caller"""
-        last.repr += "("
+        last.repr.append("(")
         return super(NoMatchSummarization, self).insert_call(call, last)
 
     def insert_return(self, last):
         """Insert return.
         Add last activation to caller and close parenthesis"""
         parent = super(NoMatchSummarization, self).insert_return(last)
-        parent.repr += last.repr + ")"
+        parent.repr.extend(last.repr)
+        parent.repr.append(")")
         return parent
 
     def insert_sequence(self, call, last):
-        """Inser last caller and comma to caller"""
-        if not last.children:
-            self.nodes[last.parent_index].repr += last.repr + ","
+        """Insert last activation and comma to caller"""
+        parent_repr = self.nodes[last.parent_index].repr
+        parent_repr.extend(last.repr)
+        parent_repr.append(",")
         return super(NoMatchSummarization, self).insert_sequence(call, last)
 
 
@@ -271,13 +304,15 @@ class StructureSummarization(Summarization):
         for trial_id in activation.trial_ids:
             node.activations[trial_id].extend(activation.activations[trial_id])
             node.duration[trial_id] += activation.duration[trial_id]
-            node.tooltip[trial_id] += activation.tooltip[trial_id] + "<br>"
+            tooltip = node.tooltip[trial_id]
+            tooltip.append(activation.tooltip[trial_id])
+            tooltip.append("<br>")
             if trial_id not in node.trial_ids:
                 node.trial_ids.append(trial_id)
 
     def calculate_match(self, node):
-        """Match by repr"""
-        return (node.repr,)
+        """Match by repr. Return str"""
+        return node.repr
 
     def __call__(self, preorder):
         return super(StructureSummarization, self).__call__(
@@ -291,12 +326,14 @@ class TreeSummarization(NoMatchSummarization):
     def __call__(self, preorder):
         result = super(TreeSummarization, self).__call__(preorder)
         self.edges.clear()
+        add_edge = self.add_edge
         stack = [self.root]
+        push = stack.append
         while stack:
             current = stack.pop()
             for index, child in enumerate(current.children):
-                self.add_edge(current, child, 'call', index)
-                stack.append(child)
+                add_edge(current, child, 'call', index)
+                push(child)
         return result
 
 
@@ -322,6 +359,10 @@ class TrialGraph(Graph):
             3: self.namespace_match
         }
 
+    def _activations(self):
+        """Return trial activations with the columns used by the graph"""
+        return Activation.fast_graph_activations(self.trial.id)
+
     def result(self, summarization):
         """Get summarization graph result"""
         return self.trial.finished, summarization.graph(
@@ -331,22 +372,22 @@ class TrialGraph(Graph):
     @cache("tree")
     def tree(self):
         """Convert tree structure into dict tree structure"""
-        return self.result(TreeSummarization(self.trial.activations))
+        return self.result(TreeSummarization(self._activations()))
 
     @cache("no_match")
     def no_match(self):
         """Convert tree structure into dict graph without node matchings"""
-        return self.result(NoMatchSummarization(self.trial.activations))
+        return self.result(NoMatchSummarization(self._activations()))
 
     @cache("exact_match")
     def exact_match(self):
         """Convert tree structure into dict graph and match equal calls"""
-        return self.result(StructureSummarization(self.trial.activations))
+        return self.result(StructureSummarization(self._activations()))
 
     @cache("namespace_match")
     def namespace_match(self):
         """Convert tree structure into dict graph and match namespaces"""
-        return self.result(LineNameSummarization(self.trial.activations))
+        return self.result(LineNameSummarization(self._activations()))
 
     def _ipython_display_(self):
         from IPython.display import display
@@ -29,7 +29,7 @@ class Object(AlchemyProxy):
                               "function_def.id"], ondelete="CASCADE"),
     )
     trial_id = Column(Integer, index=True)
-    function_def_id = Column(Integer, index=True)
+    function_def_id = Column(Integer)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
     name = Column(Text)
     type = Column(                                                               # pylint: disable=invalid-name
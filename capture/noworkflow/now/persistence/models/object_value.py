@@ -29,7 +29,7 @@ class ObjectValue(AlchemyProxy):
                               "function_activation.id"], ondelete="CASCADE"),
     )
     trial_id = Column(Integer, index=True)
-    function_activation_id = Column(Integer, index=True)
+    function_activation_id = Column(Integer)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
     name = Column(Text)
     value = Column(Text)
@@ -9,7 +9,7 @@ from __future__ import (absolute_import, print_function,
 import os
 
 from sqlalchemy import Column, Integer, Text, TIMESTAMP
-from sqlalchemy import ForeignKeyConstraint, select, func, distinct
+from sqlalchemy import ForeignKeyConstraint, Index, select, func, distinct
 
 from ...utils.formatter import PrettyLines
 from ...utils.prolog import PrologDescription, PrologTrial, PrologNullableRepr
@@ -63,6 +63,8 @@ class Trial(AlchemyProxy):
         ForeignKeyConstraint(["inherited_id"], ["trial.id"],
                              ondelete="RESTRICT"),
         ForeignKeyConstraint(["parent_id"], ["trial.id"], ondelete="SET NULL"),
+        # load_parent, find_by_name_and_time: script filter ordered by start
+        Index("ix_trial_script_start", "script", "start"),
         {"sqlite_autoincrement": True},
     )
 
@@ -80,11 +82,11 @@ class Trial(AlchemyProxy):
 
     inherited = one(
         "Trial", backref="bypass_children", viewonly=True,
-        remote_side=[id], primaryjoin=(id == inherited_id)
+        remote_side=[id], foreign_keys=[inherited_id]
     )
     parent = one(
         "Trial", backref="children", viewonly=True,
-        remote_side=[id], primaryjoin=(id == parent_id)
+        remote_side=[id], foreign_keys=[parent_id]
     )
 
     function_defs = many_ref("trial", "FunctionDef")
@@ -92,8 +94,9 @@ class Trial(AlchemyProxy):
     dmodules = many_ref("trials", "Module", secondary=Dependency.t)
     environment_attrs = many_ref("trial", "EnvironmentAttr")
     activations = many_ref("trial", "Activation",
-                           order_by=Activation.m.start)
-    file_accesses = many_viewonly_ref("trial", "FileAccess")
+                           order_by=Activation.m.id)
+    file_accesses = many_viewonly_ref("trial", "FileAccess",
+                                      order_by="FileAccess.id")
     objects = many_viewonly_ref("trial", "Object")
     object_values = many_viewonly_ref("trial", "ObjectValue")
     variables = many_viewonly_ref("trial", "Variable")
@@ -560,6 +563,25 @@ class Trial(AlchemyProxy):
         session = session or relational.session
         return proxy_gen(session.query(cls.m))
 
+    @classmethod  # query
+    def list_rows(cls, session=None):
+        """Stream the trial columns shown by "now list"
+
+        Return Core rows with id, command, code_hash, start and finish,
+        in id order, instead of building a Trial for each row
+
+
+        Keyword arguments:
+        session -- specify session for loading (default=relational.session)
+        """
+        session = session or relational.session
+        table = cls.t
+        return session.execute(
+            select([table.c.id, table.c.command, table.c.code_hash,
+                    table.c.start, table.c.finish])
+            .order_by(table.c.id)
+        )
+
     def match_status(self, status):
         """Check if trial statuses matches
         """
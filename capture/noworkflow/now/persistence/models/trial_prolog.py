@@ -9,6 +9,7 @@ from __future__ import (absolute_import, print_function,
 import weakref
 
 from ...utils.functions import resource
+from ...utils.io import write_chunks
 
 from .base import Model
 from .graphs.diagram import ViewPrologDiagram
@@ -40,14 +41,16 @@ class TrialProlog(Model):
         from . import Trial
         return [
             (Trial, lambda: [trial]),
-            (Tag, lambda: trial.tags),
+            (Tag, lambda: Tag.fast_export_rows(trial.id)),
             (Dependency, lambda: trial.dependencies),
-            (EnvironmentAttr, lambda: trial.environment_attrs),
-            (FunctionDef, lambda: trial.function_defs),
-            (Object, lambda: trial.objects),
-            (Activation, lambda: trial.activations),
-            (ObjectValue, lambda: trial.object_values),
-            (FileAccess, lambda: trial.file_accesses),
+            (EnvironmentAttr, lambda: EnvironmentAttr.fast_export_rows(
+                trial.id)),
+            (FunctionDef, lambda: FunctionDef.fast_export_rows(trial.id)),
+            (Object, lambda: Object.fast_export_rows(trial.id)),
+            (Activation, lambda: Activation.fast_export_rows(
+                trial.id, order_by="id")),
+            (ObjectValue, lambda: ObjectValue.fast_export_rows(trial.id)),
+            (FileAccess, lambda: FileAccess.fast_export_rows(trial.id)),
             (Variable, lambda: trial.prolog_variables.variables),
             (VariableUsage, lambda: trial.prolog_variables.usages),
             (VariableDependency, lambda: trial.prolog_variables.dependencies),
@@ -65,21 +68,40 @@ class TrialProlog(Model):
             list(self.prolog_cli.query(
                 cls.prolog_description.retract(self.trial.id)))
 
-    def _export_facts(self, with_doc=True):
-        """Export facts from trial as a list"""
-        result = []
+    def _iter_facts(self, with_doc=True):
+        """Generate facts from trial"""
         for cls, query in self.models:
+            description = cls.prolog_description
             if with_doc:
-                result.append(cls.prolog_description.comment())
-            result.append(cls.prolog_description.dynamic())
+                yield description.comment()
+            yield description.dynamic()
+            fact = description.compiled_fact
             for obj in query():
-                result.append(cls.prolog_description.fact(obj))
-        return result
+                yield fact(obj)
+
+    def _export_facts(self, with_doc=True):
+        """Export facts from trial as a list"""
+        return list(self._iter_facts(with_doc))
 
     def export_text_facts(self):
         """Export facts from trial as text"""
         return "\n".join(self._export_facts())
 
+    def write_facts(self, out, with_doc=True, buffer_size=65536):
+        """Write facts from trial to a file-like object, one per line
+
+        Facts are written in chunks of about buffer_size characters,
+        instead of building the whole text in memory
+
+
+        Keyword arguments:
+        with_doc -- write fact descriptions (default=True)
+        buffer_size -- approximate chunk size (default=65536)
+        """
+        write_chunks(out, (
+            fact + "\n" for fact in self._iter_facts(with_doc)
+        ), buffer_size)
+
     def rules(self, with_facts=False):
         """Export prolog rules
 
@@ -33,7 +33,7 @@ class Variable(AlchemyProxy):
         ForeignKeyConstraint(["trial_id"], ["trial.id"], ondelete="CASCADE"),
     )
     trial_id = Column(Integer, index=True)
-    activation_id = Column(Integer, index=True)
+    activation_id = Column(Integer)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
     name = Column(Text)
     line = Column(Integer)
@@ -117,6 +117,34 @@ class Variable(AlchemyProxy):
         return proxy(self._get_instance().dependencies.filter(
             Variable.m.name.like("%box--")).first())
 
+    @classmethod  # query
+    def fast_return_dependencies(cls, trial_id, session=None):
+        """Return "return" dependencies of all call variables in trial
+
+        Return dict that maps (activation_id, id) of each call variable to
+        the SQLAlchemy object of its "return" dependency
+        """
+        session = session or relational.session
+        model = cls.m
+        dependency = VariableDependency.m
+        query = (
+            session.query(
+                dependency.source_activation_id, dependency.source_id, model)
+            .join(model, (
+                (model.trial_id == dependency.trial_id) &
+                (model.activation_id == dependency.target_activation_id) &
+                (model.id == dependency.target_id)
+            ))
+            .filter(
+                (dependency.trial_id == trial_id) &
+                (model.name == "return")
+            )
+        )
+        result = {}
+        for activation_id, variable_id, return_ in query:
+            result.setdefault((activation_id, variable_id), return_)
+        return result
+
     @classmethod  # query
     def fast_arg_and_original(cls, trial_id, session=None):
         """Return tuples with variable of type arg and original variable"""
@@ -7,7 +7,7 @@ from __future__ import (absolute_import, print_function,
                         division, unicode_literals)
 
 from sqlalchemy import Column, Integer, Text, select
-from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint, Index
 
 from ...utils.prolog import PrologDescription, PrologTrial, PrologAttribute
 
@@ -43,13 +43,19 @@ class VariableDependency(AlchemyProxy):
                              ["variable.trial_id",
                               "variable.activation_id",
                               "variable.id"], ondelete="CASCADE"),
+        # Variable.dependencies_as_source, Activation.source_variables
+        Index("ix_variable_dependency_source",
+              "trial_id", "source_activation_id", "source_id"),
+        # Variable.dependencies_as_target, Activation.target_variables
+        Index("ix_variable_dependency_target",
+              "trial_id", "target_activation_id", "target_id"),
     )
     trial_id = Column(Integer, index=True)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
-    source_activation_id = Column(Integer, index=True)
-    source_id = Column(Integer, index=True)
-    target_activation_id = Column(Integer, index=True)
-    target_id = Column(Integer, index=True)
+    source_activation_id = Column(Integer)
+    source_id = Column(Integer)
+    target_activation_id = Column(Integer)
+    target_id = Column(Integer)
     type = Column(Text)                                                          # pylint: disable=invalid-name
 
     trial = backref_one("trial")  # Trial.variable_dependencies
@@ -7,7 +7,7 @@ from __future__ import (absolute_import, print_function,
                         division, unicode_literals)
 
 from sqlalchemy import Column, Integer, Text
-from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, ForeignKeyConstraint, Index
 from sqlalchemy import CheckConstraint
 
 from ...utils.prolog import PrologDescription, PrologTrial, PrologAttribute
@@ -32,10 +32,13 @@ class VariableUsage(AlchemyProxy):
                              ["variable.trial_id",
                               "variable.activation_id",
                               "variable.id"], ondelete="CASCADE"),
+        # Activation.variables_usages, Variable.usages
+        Index("ix_variable_usage_variable",
+              "trial_id", "activation_id", "variable_id"),
     )
     trial_id = Column(Integer, index=True)
-    activation_id = Column(Integer, index=True)
-    variable_id = Column(Integer, index=True)
+    activation_id = Column(Integer)
+    variable_id = Column(Integer)
     id = Column(Integer, index=True)                                             # pylint: disable=invalid-name
     line = Column(Integer)
     context = Column(Text, CheckConstraint("context IN ('Load', 'Del')"))
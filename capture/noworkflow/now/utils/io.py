@@ -49,6 +49,23 @@ def print_msg(message, force=False, file=STDOUT):
         print("{}{}".format(LABEL, message), file=file)
 
 
+def write_chunks(out, texts, buffer_size=65536):
+    """Write texts to a file-like object in chunks of about buffer_size
+    characters, instead of building the whole output in memory
+
+    Texts are written without separators
+    """
+    chunk, size = [], 0
+    for text in texts:
+        chunk.append(text)
+        size += len(text)
+        if size >= buffer_size:
+            out.write("".join(chunk))
+            chunk, size = [], 0
+    if chunk:
+        out.write("".join(chunk))
+
+
 def print_fn_msg(message, force=False, file=STDOUT):
     """Print lazy message with [now] prefix"""
     if verbose or force:
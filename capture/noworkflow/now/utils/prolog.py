@@ -6,9 +6,56 @@
 
 
 from datetime import datetime
+from operator import attrgetter
 from string import ascii_letters
 
 
+EPOCH = datetime(1970, 1, 1)
+
+
+def repr_fact(value):
+    """Return value as escaped repr"""
+    if not isinstance(value, str):
+        value = repr(value)
+
+    if len(value) > 1:
+        if value[0] in ascii_letters and value[1] in ('"', "'"):
+            value = value[1:]
+        if value[0] in ('"', "'") and value[-1] == value[0]:
+            value = value[1:-1]
+
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def nullable_repr_fact(value):
+    """Return value as escaped repr or nil"""
+    if not value:
+        return "nil"
+    return repr_fact(value)
+
+
+def nullable_fact(value):
+    """Return value as str or nil"""
+    return str(value) if value else "nil"
+
+
+def timestamp_fact(time):
+    """Return time as seconds since EPOCH"""
+    if PrologTimestamp.use_nil:
+        return "nil"
+    if not time:
+        return "-1"
+    return str((time - EPOCH).total_seconds())
+
+
+FORMATTERS = {
+    "repr_fact": repr_fact,
+    "nullable_repr_fact": nullable_repr_fact,
+    "nullable_fact": nullable_fact,
+    "timestamp_fact": timestamp_fact,
+}
+
+
 class PrologDescription(object):
     """Prolog Description. Generate comments, facts, dynamic, and retract"""
 
@@ -16,6 +63,31 @@ class PrologDescription(object):
         self.name = name
         self.attributes = attributes
         self.description = description.split("\n")
+        self.compiled_fact = self.compile_fact()
+
+    def compile_fact(self):
+        """Generate a function that converts an object into a prolog fact
+
+        Plain attributes, including dotted paths, are inlined as attribute
+        accesses, wrapped by their value formatter. Attributes with custom
+        functions call their own fact method
+        """
+        namespace = dict(FORMATTERS)
+        namespace["prefix"] = self.name + "("
+        parts = []
+        for index, attribute in enumerate(self.attributes):
+            expression = attribute.expression("obj")
+            if expression is None:
+                name = "fact{}".format(index)
+                namespace[name] = attribute.fact
+                expression = "{}(obj)".format(name)
+            parts.append(expression)
+        source = "def fact(obj):\n    return prefix + {} + ').'\n".format(
+            " + ', ' + ".join(parts)
+        )
+        exec(compile(source, "<prolog {}>".format(self.name), "exec"),           # pylint: disable=exec-used
+             namespace)
+        return namespace["fact"]
 
     def comment(self):
         """Return prolog comment"""
@@ -43,9 +115,7 @@ class PrologDescription(object):
 
     def fact(self, obj):
         """Convert obj to prolog fact"""
-        return "{0.name}({1}).".format(
-            self, ', '.join(x.fact(obj) for x in self.attributes)
-        )
+        return self.compiled_fact(obj)
 
     def empty(self):
         """Return empty fact"""
@@ -67,6 +137,7 @@ class PrologAttribute(object):
         self.attr_name = self.name if attr_name is None else attr_name
         self.func = fn
         self.link = link
+        self.getter = attrgetter(self.attr_name)
 
     def variable(self):
         return "".join(x.title() for x in self.name.split("_"))
@@ -75,11 +146,7 @@ class PrologAttribute(object):
         """Return attribute self.attr_name of obj"""
         if self.func:
             return self.func(obj)
-        attr = self.attr_name
-        while "." in attr:
-            attr0, attr = attr.split(".", 1)
-            obj = getattr(obj, attr0)
-        return getattr(obj, attr)
+        return self.getter(obj)
 
     def retract(self, trial_id):                                                 # pylint: disable=unused-argument, no-self-use
         """Attribute does not identify fact. Retrun _"""
@@ -89,6 +156,15 @@ class PrologAttribute(object):
         """Return attribute self.attr_name of obj as str"""
         return str(self.value(obj))
 
+    formatter = "str"
+
+    def expression(self, var):
+        """Return Python expression that produces the fact from variable var
+        Return None if the attribute cannot be inlined"""
+        if self.func:
+            return None
+        return "{}({}.{})".format(self.formatter, var, self.attr_name)
+
     def empty(self):                                                             # pylint: disable=no-self-use
         """Represent empty attribute"""
         return "0"
@@ -105,51 +181,39 @@ class PrologTrial(PrologAttribute):
 class PrologRepr(PrologAttribute):
     """Represent an attribute that should be written with quotes"""
 
+    formatter = "repr_fact"
+
     def fact(self, obj):
         """Return attribute self.attr_name of obj as escaped repr"""
-        value = self.value(obj)
-        if not isinstance(value, str):
-            value = repr(value)
-
-        if len(value) > 1:
-            if value[0] in ascii_letters and value[1] in ('"', "'"):
-                value = value[1:]
-            if value[0] in ('"', "'") and value[-1] == value[0]:
-                value = value[1:-1]
-
-        return "'{}'".format(value.replace("'", "''"))
+        return repr_fact(self.value(obj))
 
 
 class PrologTimestamp(PrologAttribute):
     """Represent a timestamp"""
 
     use_nil = False
+    formatter = "timestamp_fact"
 
     def fact(self, obj):
         """Return attribute self.attr_name of obj as formatted timestamp"""
-        if PrologTimestamp.use_nil:
-            return "nil"
-        time = self.value(obj)
-        if not time:
-            return -1
-        epoch = datetime(1970, 1, 1)
-        return str((time - epoch).total_seconds())
+        return timestamp_fact(self.value(obj))
 
 
 class PrologNullable(PrologAttribute):
     """Represent an attribute that accepts nil as value"""
 
+    formatter = "nullable_fact"
+
     def fact(self, obj):
         """Replace None by nil if attribute self.attr_name of obj"""
-        value = self.value(obj)
-        return str(value) if value else "nil"
+        return nullable_fact(self.value(obj))
 
 
 class PrologNullableRepr(PrologRepr):
     """Represent an attribute that accepts nil as value and requires quotes"""
 
+    formatter = "nullable_repr_fact"
+
     def fact(self, obj):
         """Return attribute self.attr_name of obj as escaped repr"""
-        if not self.value(obj):
-            return "nil"
-        return super(PrologNullableRepr, self).fact(obj)
+        return nullable_repr_fact(self.value(obj))
@@ -17,3 +17,5 @@ from .prov_execution import TestCallSlicing
 from .prov_deployment import TestProvDeployment
 from .cross_version_test import TestCrossVersion
 from .formatter_test import TestFormatter
+from .prolog_test import TestProlog
+from .trial_graph_test import TestTrialGraph
@@ -0,0 +1,45 @@
+# Copyright (c) 2016 Universidade Federal Fluminense (UFF)
+# Copyright (c) 2016 Polytechnic Institute of New York University.
+# This file is part of noWorkflow.
+# Please, consult the license terms in the LICENSE file.
+"""Test now.utils.prolog module"""
+from __future__ import (absolute_import, print_function,
+                        division, unicode_literals)
+
+import unittest
+
+from collections import namedtuple
+from datetime import datetime
+
+from ..now.utils.prolog import PrologDescription, PrologTrial
+from ..now.utils.prolog import PrologTimestamp
+
+
+Row = namedtuple("Row", "trial_id start finish")                                 # pylint: disable=invalid-name
+
+
+DESCRIPTION = PrologDescription("activation", (
+    PrologTrial("trial_id"),
+    PrologTimestamp("start"),
+    PrologTimestamp("finish"),
+))
+
+
+class TestProlog(unittest.TestCase):
+    """TestCase for now.utils.prolog module"""
+
+    def test_fact_with_none_timestamp(self):
+        row = Row(1, datetime(1970, 1, 1, 0, 0, 1), None)
+        self.assertEqual("activation(1, 1.0, -1).", DESCRIPTION.fact(row))
+
+    def test_fact_with_hidden_timestamps(self):
+        row = Row(1, datetime(1970, 1, 1, 0, 0, 1), None)
+        PrologTimestamp.use_nil = True
+        try:
+            self.assertEqual("activation(1, nil, nil).", DESCRIPTION.fact(row))
+        finally:
+            PrologTimestamp.use_nil = False
+
+    def test_attribute_fact_with_none_timestamp(self):
+        row = Row(1, None, None)
+        self.assertEqual("-1", PrologTimestamp("finish").fact(row))
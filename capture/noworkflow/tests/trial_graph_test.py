@@ -0,0 +1,56 @@
+# Copyright (c) 2016 Universidade Federal Fluminense (UFF)
+# Copyright (c) 2016 Polytechnic Institute of New York University.
+# This file is part of noWorkflow.
+# Please, consult the license terms in the LICENSE file.
+"""Test trial graph summarizations"""
+from __future__ import (absolute_import, print_function,
+                        division, unicode_literals)
+
+import unittest
+
+from ..now.persistence.models.activation import ActivationRef
+from ..now.persistence.models.graphs.trial_graph import NoMatchSummarization
+from ..now.persistence.models.graphs.trial_graph import StructureSummarization
+
+
+def activation(aid, name, line, caller_id=None):
+    """Create activation of trial 1 for summarization preorders"""
+    return ActivationRef(1, aid, name, line, caller_id, 10)
+
+
+class TestTrialGraph(unittest.TestCase):
+    """TestCase for trial graph summarizations"""
+
+    def test_no_match_repr_includes_sibling_with_calls(self):
+        preorder = [
+            activation(1, "s", 1),
+            activation(2, "a", 2, caller_id=1),
+            activation(3, "b", 3, caller_id=2),
+            activation(4, "c", 4, caller_id=1),
+        ]
+        summarization = NoMatchSummarization(preorder)
+        self.assertEqual("1-s(2-a(3-b),4-c)", summarization.root.repr)
+
+    def test_exact_match_merges_equal_structures(self):
+        preorder = [
+            activation(1, "s", 1),
+            activation(2, "a", 2, caller_id=1),
+            activation(3, "b", 3, caller_id=2),
+            activation(4, "a", 2, caller_id=1),
+            activation(5, "b", 3, caller_id=4),
+        ]
+        summarization = StructureSummarization(preorder)
+        children = summarization.root.children
+        self.assertEqual(1, len(children))
+        self.assertEqual([2, 4], children[0].activations[1])
+
+    def test_exact_match_keeps_different_structures(self):
+        preorder = [
+            activation(1, "s", 1),
+            activation(2, "a", 2, caller_id=1),
+            activation(3, "b", 3, caller_id=2),
+            activation(4, "a", 2, caller_id=1),
+            activation(5, "c", 4, caller_id=4),
+        ]
+        summarization = StructureSummarization(preorder)
+        self.assertEqual(2, len(summarization.root.children))